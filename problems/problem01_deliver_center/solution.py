@@ -1,53 +1,75 @@
 import sys
-from functools import total_ordering
-
-@total_ordering
+import re
+import heapq
+from collections import OrderedDict
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+
+# イベント種別（同じ分に複数のイベントがあっても処理順序はステップ1〜3で決まる）
+EVENT_QUERY = 0             # クエリの到着
+EVENT_COMPLETION = 1        # 配達完了
+EVENT_SCHEDULED_START = 2   # SCHEDULED配達の割り当て時刻
+EVENT_BUSY_END = 3          # 忙しい時間帯の終了（待機中の配達が割り当て可能になりうる）
+
+# クエリ1行分: 日付 時刻 種別 配達ID [配達時間 [予定日付 予定時刻]]
+QUERY_PATTERN = re.compile(
+    rb'^[ \t]*(\d+)[ \t]+(\d+):(\d+)[ \t]+(NORMAL|EXPRESS|SCHEDULED|CANCEL|STATUS)[ \t]+(\S+)'
+    rb'(?:[ \t]+(-?\d+)(?:[ \t]+(\d+)[ \t]+(\d+):(\d+))?)?',
+    re.MULTILINE,
+)
+
+MAX_SCHEDULED_DURATION = 60  # SCHEDULED配達の配達時間の上限（忙しい時間帯の長さの上限）
+
+def overlaps_busy_periods(busy_periods, start, end):
+    """[start, end) が忙しい時間帯と重複するかチェック
+
+    busy_periods は開始時刻順に並んだ (開始分, 終了分) のリストで、互いに重ならない。
+    各時間帯の長さは MAX_SCHEDULED_DURATION 以下なので、調べるのは開始分が
+    start - MAX_SCHEDULED_DURATION 以上 end 未満の範囲だけでよい。
+    """
+    lo = bisect_left(busy_periods, (start - MAX_SCHEDULED_DURATION,))
+    hi = bisect_left(busy_periods, (end,), lo)
+    for i in range(lo, hi):
+        if busy_periods[i][1] > start:
+            return True
+    return False
+
+@dataclass(frozen=True, order=True, slots=True)
 class Time:
-    """時刻を管理するクラス"""
-    def __init__(self, d, h, m):
-        self.d = d
-        self.h = h
-        self.m = m
+    """時刻を管理するクラス（比較は日付1の00:00からの経過分数だけで行う）"""
+    _min: int
+    d: int = field(compare=False)
+    h: int = field(compare=False)
+    m: int = field(compare=False)
+
+    @classmethod
+    def make(cls, d, h, m):
+        """日付・時・分から Time オブジェクトを作成"""
+        return cls((d - 1) * 24 * 60 + h * 60 + m, d, h, m)
 
     def __str__(self):
         return f"{self.d} {str(self.h).zfill(2)}:{str(self.m).zfill(2)}"
 
-    def step(self):
-        """1分進める"""
-        self.m += 1
-        if self.m == 60:
-            self.m = 0
-            self.h += 1
-        if self.h == 24:
-            self.h = 0
-            self.d += 1
-
     def minutes(self):
         """日付1の00:00からの経過分数を返す"""
-        return (self.d - 1) * 24 * 60 + self.h * 60 + self.m
-
-    def __eq__(self, other):
-        return self.d == other.d and self.h == other.h and self.m == other.m
-
-    def __lt__(self, other):
-        return self.minutes() < other.minutes()
+        return self._min
 
     def add(self, minutes):
         """指定した分数だけ進めた新しいTimeオブジェクトを返す"""
-        time = Time(self.d, self.h, self.m)
-        for _ in range(minutes):
-            time.step()
-        return time
+        return Time.from_minutes(self.minutes() + minutes)
 
     @classmethod
-    def from_string(cls, day_str, time_str):
-        """文字列から Time オブジェクトを作成"""
-        day = int(day_str)
-        h, m = map(int, time_str.split(":"))
-        return cls(day, h, m)
+    def from_minutes(cls, total):
+        """日付1の00:00からの経過分数から Time オブジェクトを作成"""
+        d, rem = divmod(total, 24 * 60)
+        h, m = divmod(rem, 60)
+        return cls(total, d + 1, h, m)
 
 class Request:
     """配達リクエストを管理するクラス"""
+    __slots__ = ("time", "type_", "id_", "duration", "status", "scheduled_time",
+                 "completion_time", "queue", "required_start")
+
     def __init__(self, time, type_, id_, duration, scheduled_time=None):
         self.time = time
         self.type_ = type_
@@ -56,30 +78,24 @@ class Request:
         self.status = "awaiting"  # awaiting, delivering, delivered
         self.scheduled_time = scheduled_time  # SCHEDULEDタイプの場合の配達予定時刻
         self.completion_time = None  # 配達完了予定時刻
+        self.queue = None  # このリクエストを保持しているキュー
+        self.required_start = None  # SCHEDULEDタイプの場合の割り当て時刻（経過分数）
 
     def is_valid_duration(self):
         """配達時間が有効かチェック"""
         if self.type_ in ["NORMAL", "EXPRESS"]:
             return self.duration <= 120
         elif self.type_ == "SCHEDULED":
-            return self.duration <= 60
+            return self.duration <= MAX_SCHEDULED_DURATION
         return False
 
     def get_delivery_period(self):
-        """SCHEDULED配達の配達時間帯を返す（開始時刻, 終了時刻）"""
+        """SCHEDULED配達の配達時間帯を返す（開始分, 終了分）"""
         if self.type_ != "SCHEDULED" or not self.scheduled_time:
             return None
-        start_time = Time(self.scheduled_time.d, self.scheduled_time.h, self.scheduled_time.m)
         # 配達時間分だけ前に戻る
-        for _ in range(self.duration):
-            start_time.m -= 1
-            if start_time.m < 0:
-                start_time.m = 59
-                start_time.h -= 1
-            if start_time.h < 0:
-                start_time.h = 23
-                start_time.d -= 1
-        return (start_time, self.scheduled_time)
+        end_min = self.scheduled_time.minutes()
+        return (end_min - self.duration, end_min)
 
     def __repr__(self):
         return f"Request({self.id_}, {self.type_}, {self.status})"
@@ -87,60 +103,44 @@ class Request:
 class Queue:
     """配達リクエストのキューを管理するクラス"""
     def __init__(self):
-        self.requests = []
+        self.requests = OrderedDict()  # delivery_id -> Request（追加順）
 
     def add(self, request):
         """リクエストを追加"""
-        self.requests.append(request)
+        self.requests[request.id_] = request
+        request.queue = self
 
     def search_and_remove(self, current_time, busy_periods):
-        """条件に合うリクエストを検索して削除"""
-        for i, req in enumerate(self.requests):
+        """条件に合うリクエストを検索して削除（busy_periods は (開始分, 終了分) のソート済みリスト）"""
+        start = current_time.minutes()
+        for req in self.requests.values():
             if req.status == "awaiting":
                 # 忙しい時間帯との重複チェック
-                delivery_end = current_time.add(req.duration)
-                if not self._is_conflicting_with_busy_periods(current_time, delivery_end, busy_periods):
-                    return self.requests.pop(i)
+                if not overlaps_busy_periods(busy_periods, start, start + req.duration):
+                    return self.remove_by_id(req.id_)
         return None
 
     def search_earliest_and_remove(self):
         """最も早い時刻のリクエストを検索して削除"""
-        if not self.requests:
-            return None
-        
-        earliest_idx = 0
-        for i, req in enumerate(self.requests):
-            if req.status == "awaiting" and req.time < self.requests[earliest_idx].time:
-                earliest_idx = i
+        earliest = None
+        for req in self.requests.values():
+            if req.status == "awaiting" and (earliest is None or req.time < earliest.time):
+                earliest = req
         
-        if self.requests[earliest_idx].status == "awaiting":
-            return self.requests.pop(earliest_idx)
+        if earliest:
+            return self.remove_by_id(earliest.id_)
         return None
 
-    def _is_conflicting_with_busy_periods(self, start_time, end_time, busy_periods):
-        """忙しい時間帯と重複するかチェック"""
-        for busy_start, busy_end in busy_periods:
-            if self._time_overlap(start_time, end_time, busy_start, busy_end):
-                return True
-        return False
-
-    def _time_overlap(self, start1, end1, start2, end2):
-        """2つの時間帯が重複するかチェック"""
-        return not (end1.minutes() <= start2.minutes() or end2.minutes() <= start1.minutes())
-
     def remove_by_id(self, delivery_id):
         """IDでリクエストを削除"""
-        for i, req in enumerate(self.requests):
-            if req.id_ == delivery_id:
-                return self.requests.pop(i)
-        return None
+        request = self.requests.pop(delivery_id, None)
+        if request:
+            request.queue = None
+        return request
 
     def find_by_id(self, delivery_id):
         """IDでリクエストを検索"""
-        for req in self.requests:
-            if req.id_ == delivery_id:
-                return req
-        return None
+        return self.requests.get(delivery_id)
 
 class Postman:
     """配達員を管理するクラス"""
@@ -172,55 +172,50 @@ class System:
         self.express_queue = Queue()
         self.normal_queue = Queue()
         self.scheduled_queue = Queue()
+        self.scheduled_by_start = {}  # 割り当て時刻（経過分数） -> SCHEDULED の Request
         self.all_requests = {}  # delivery_id -> Request のマッピング
-        self.busy_periods = []  # (start_time, end_time) のリスト
-
-    def parse_query(self, line):
-        """クエリをパース"""
-        parts = line.strip().split()
-        if len(parts) < 3:
-            return None
-        
-        day = parts[0]
-        time_str = parts[1]
-        query_type = parts[2]
-        
-        time_obj = Time.from_string(day, time_str)
-        
-        if query_type in ["NORMAL", "EXPRESS"]:
-            if len(parts) >= 5:
-                delivery_id = parts[3]
-                duration = int(parts[4])
-                return {
-                    "type": query_type,
-                    "time": time_obj,
-                    "delivery_id": delivery_id,
-                    "duration": duration
-                }
-        elif query_type == "SCHEDULED":
-            if len(parts) >= 7:
-                delivery_id = parts[3]
-                duration = int(parts[4])
-                scheduled_day = parts[5]
-                scheduled_time = parts[6]
-                scheduled_time_obj = Time.from_string(scheduled_day, scheduled_time)
-                return {
-                    "type": query_type,
-                    "time": time_obj,
-                    "delivery_id": delivery_id,
-                    "duration": duration,
-                    "scheduled_time": scheduled_time_obj
-                }
-        elif query_type in ["CANCEL", "STATUS"]:
-            if len(parts) >= 4:
-                delivery_id = parts[3]
-                return {
-                    "type": query_type,
-                    "time": time_obj,
-                    "delivery_id": delivery_id
-                }
+        self.busy_periods = []  # (開始分, 終了分) のリスト（開始分の昇順）
+        self.events = []  # (経過分数, イベント種別) のヒープ
+
+    def push_event(self, minutes, event_type):
+        """イベントを登録"""
+        heapq.heappush(self.events, (minutes, event_type))
+
+    def push_next_busy_end(self, current_minutes):
+        """現在より後で最も早い忙しい時間帯の終了時刻をイベントとして登録"""
+        # 忙しい時間帯は互いに重ならないので、終了分も開始分と同じ順に並ぶ
+        i = bisect_left(self.busy_periods, (current_minutes - MAX_SCHEDULED_DURATION,))
+        busy_periods = self.busy_periods
+        for j in range(i, len(busy_periods)):
+            end = busy_periods[j][1]
+            if end > current_minutes:
+                self.push_event(end, EVENT_BUSY_END)
+                return
+
+    def parse_queries(self, data):
+        """入力全体（bytes）からクエリを一括でパース"""
+        queries = []
+        for (day, hour, minute, query_type, delivery_id, duration,
+                scheduled_day, scheduled_hour, scheduled_minute) in QUERY_PATTERN.findall(data):
+            query_type = query_type.decode()
+            query = {
+                "type": query_type,
+                "time": Time.make(int(day), int(hour), int(minute)),
+                "delivery_id": delivery_id.decode(),
+            }
+            
+            if query_type in ["NORMAL", "EXPRESS", "SCHEDULED"]:
+                if not duration:
+                    continue
+                query["duration"] = int(duration)
+            if query_type == "SCHEDULED":
+                if not scheduled_day:
+                    continue
+                query["scheduled_time"] = Time.make(int(scheduled_day), int(scheduled_hour), int(scheduled_minute))
+            
+            queries.append(query)
         
-        return None
+        return queries
 
     def process_delivery_request(self, query):
         """配達リクエストを処理"""
@@ -259,13 +254,15 @@ class System:
             # 忙しい時間帯との重複チェック
             delivery_period = request.get_delivery_period()
             if delivery_period:
-                start_time, end_time = delivery_period
-                for busy_start, busy_end in self.busy_periods:
-                    if self._time_overlap(start_time, end_time, busy_start, busy_end):
-                        return f"{time_obj} ERROR: The scheduled delivery time cannot be specified because the delivery person is busy making another delivery."
+                start_min, end_min = delivery_period
+                if overlaps_busy_periods(self.busy_periods, start_min, end_min):
+                    return f"{time_obj} ERROR: The scheduled delivery time cannot be specified because the delivery person is busy making another delivery."
                 
                 # 忙しい時間帯に追加
-                self.busy_periods.append((start_time, end_time))
+                insort(self.busy_periods, delivery_period)
+                request.required_start = start_min
+                self.scheduled_by_start[start_min] = request
+                self.push_event(start_min, EVENT_SCHEDULED_START)
         
         # リクエストを受理
         self.all_requests[delivery_id] = request
@@ -298,13 +295,15 @@ class System:
         # SCHEDULEDの場合は忙しい時間帯から削除
         if request.type_ == "SCHEDULED":
             delivery_period = request.get_delivery_period()
-            if delivery_period and delivery_period in self.busy_periods:
-                self.busy_periods.remove(delivery_period)
+            if delivery_period:
+                i = bisect_left(self.busy_periods, delivery_period)
+                if i < len(self.busy_periods) and self.busy_periods[i] == delivery_period:
+                    del self.busy_periods[i]
+            self.scheduled_by_start.pop(request.required_start, None)
         
-        # 各キューから削除
-        self.express_queue.remove_by_id(delivery_id)
-        self.normal_queue.remove_by_id(delivery_id)
-        self.scheduled_queue.remove_by_id(delivery_id)
+        # 保持しているキューから削除
+        if request.queue:
+            request.queue.remove_by_id(delivery_id)
         
         # 全体のリクエストからも削除
         del self.all_requests[delivery_id]
@@ -343,16 +342,20 @@ class System:
         if not self.postman.is_available():
             return None
         
-        # SCHEDULED配達のチェック
-        for req in self.scheduled_queue.requests:
-            if req.status == "awaiting" and req.scheduled_time:
-                # 現在時刻から配達時間後が配達予定時刻と一致するかチェック
-                expected_completion = current_time.add(req.duration)
-                if expected_completion == req.scheduled_time:
-                    self.scheduled_queue.remove_by_id(req.id_)
-                    req.completion_time = expected_completion
-                    self.postman.assign(req)
-                    return f"{current_time} {req.id_} has been assigned."
+        message = self._assign_delivery(current_time)
+        if message:
+            self.push_event(self.postman.current_request.completion_time.minutes(), EVENT_COMPLETION)
+        return message
+
+    def _assign_delivery(self, current_time):
+        """割り当てるべき配達リクエストを探して配達員に割り当てる"""
+        # SCHEDULED配達のチェック（現在時刻から配達時間後が配達予定時刻と一致するもの）
+        req = self.scheduled_by_start.pop(current_time.minutes(), None)
+        if req:
+            self.scheduled_queue.remove_by_id(req.id_)
+            req.completion_time = req.scheduled_time
+            self.postman.assign(req)
+            return f"{current_time} {req.id_} has been assigned."
         
         # EXPRESS配達のチェック
         express_req = self.express_queue.search_and_remove(current_time, self.busy_periods)
@@ -370,10 +373,6 @@ class System:
         
         return None
 
-    def _time_overlap(self, start1, end1, start2, end2):
-        """2つの時間帯が重複するかチェック"""
-        return not (end1.minutes() <= start2.minutes() or end2.minutes() <= start1.minutes())
-
     def process_query(self, query):
         """クエリを処理"""
         if query["type"] in ["NORMAL", "EXPRESS", "SCHEDULED"]:
@@ -388,51 +387,49 @@ class System:
 def main():
     system = System()
     
-    # 入力を読み込み
-    queries = []
-    for line in sys.stdin:
-        if line.strip():
-            query = system.parse_query(line)
-            if query:
-                queries.append(query)
-    
-
+    # 入力を一括で読み込み
+    queries = system.parse_queries(sys.stdin.buffer.read())
     
+    for query in queries:
+        system.push_event(query["time"].minutes(), EVENT_QUERY)
     
-    current_time = Time(1, 0, 0)
     query_index = 0
+    out = []  # 出力はまとめて最後に書き出す
+    out_append = out.append
+    
+    # 何かが起こりうる時刻だけを順に処理する
+    while system.events:
+        current_minutes = system.events[0][0]
+        fired = set()  # この時刻に発生したイベント種別
+        while system.events and system.events[0][0] == current_minutes:
+            fired.add(heapq.heappop(system.events)[1])
+        current_time = Time.from_minutes(current_minutes)
         
-        # システム実行中フラグ
-    running = True
+        # Step 1: 配達完了チェック（完了時刻は割り当て時にイベントとして登録済み）
+        if EVENT_COMPLETION in fired:
+            completion_msg = system.check_completion(current_time)
+            if completion_msg:
+                out_append(completion_msg)
         
-    while running:
-            # Step 1: 配達完了チェック
-        completion_msg = system.check_completion(current_time)
-        if completion_msg:
-            print(completion_msg)
-            
-            # Step 2: クエリ処理
-        if query_index < len(queries) and queries[query_index]["time"] == current_time:
+        # Step 2: クエリ処理
+        while EVENT_QUERY in fired and query_index < len(queries) and queries[query_index]["time"] == current_time:
             query_result = system.process_query(queries[query_index])
             if query_result:
-                print(query_result)
+                out_append(query_result)
             query_index += 1
-            
-            # Step 3: 配達割り当て
+        
+        # Step 3: 配達割り当て
         assignment_msg = system.assign_delivery(current_time)
         if assignment_msg:
-            print(assignment_msg)
-            
-            # 次の時刻へ
-        current_time.step()
-            
-            # 終了条件: 全クエリ処理済み かつ 配達員が空いている かつ キューが空
-        if (query_index >= len(queries) and 
-            system.postman.is_available() and 
-            len(system.express_queue.requests) == 0 and 
-            len(system.normal_queue.requests) == 0 and 
-            len(system.scheduled_queue.requests) == 0):
-            running = False
+            out_append(assignment_msg)
+        
+        # 配達員が空いているのに割り当てられない配達は、忙しい時間帯が終わるまで待つ
+        if (system.postman.is_available() and
+                (system.express_queue.requests or system.normal_queue.requests)):
+            system.push_next_busy_end(current_minutes)
+    
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -1,73 +1,90 @@
 import sys
 from typing import Dict, List, Tuple, Optional
 
+# 時間帯割引の適用時間（00:00からの経過分数、開始含む・終了含まない）
+MORNING = (6 * 60, 10 * 60)   # 06:00〜10:00
+LUNCH = (11 * 60, 14 * 60)    # 11:00〜14:00
+HAPPY = (17 * 60, 19 * 60)    # 17:00〜19:00
+NIGHT = (22 * 60, 6 * 60)     # 22:00〜06:00
+
+def in_range(current: int, start: int, end: int) -> bool:
+    """経過分数が時間範囲内かチェック（start含む、end含まない）"""
+    if start < end:
+        # 通常の時間範囲（例：09:00-22:00）
+        return start <= current < end
+    else:
+        # 日付をまたぐ時間範囲（例：22:00-06:00）
+        return current >= start or current < end
+
 class Time:
     """時刻を管理するクラス"""
+    __slots__ = ("hour", "minute", "minute_of_day")
+    
     def __init__(self, time_str: str):
         parts = time_str.split(':')
         self.hour = int(parts[0])
         self.minute = int(parts[1])
-    
-    def to_minutes(self) -> int:
-        """00:00からの経過分数を返す"""
-        return self.hour * 60 + self.minute
-    
-    def is_in_range(self, start_str: str, end_str: str) -> bool:
-        """指定された時間範囲内かチェック（start含む、end含まない）"""
-        start = Time(start_str)
-        end = Time(end_str)
-        current = self.to_minutes()
-        
-        if start.to_minutes() < end.to_minutes():
-            # 通常の時間範囲（例：09:00-22:00）
-            return start.to_minutes() <= current < end.to_minutes()
-        else:
-            # 日付をまたぐ時間範囲（例：22:00-06:00）
-            return current >= start.to_minutes() or current < end.to_minutes()
+        self.minute_of_day = self.hour * 60 + self.minute  # 00:00からの経過分数
     
     def __str__(self):
         return f"{self.hour:02d}:{self.minute:02d}"
 
 class Product:
     """商品を管理するクラス"""
-    def __init__(self, product_id: str, name: str, price: int, category: str):
+    __slots__ = ("id", "name", "price", "category", "idx")
+    
+    def __init__(self, product_id: str, name: str, price: int, category: str, idx: int):
         self.id = product_id
         self.name = name
         self.price = price
         self.category = category
+        self.idx = idx  # 在庫リストの添字
 
 class Store:
     """店舗を管理するクラス"""
+    __slots__ = ("id", "open_time", "close_time", "open_minutes", "close_minutes", "inventory")
+    
     def __init__(self, store_id: str, open_time: str, close_time: str):
         self.id = store_id
         self.open_time = open_time
         self.close_time = close_time
-        self.inventory: Dict[str, int] = {}  # product_id -> stock count
+        self.open_minutes = Time(open_time).minute_of_day
+        self.close_minutes = Time(close_time).minute_of_day
+        self.inventory: List[Optional[int]] = []  # 商品の添字 -> stock count（未入荷は None）
     
     def is_open(self, time: Time) -> bool:
         """営業時間内かチェック"""
-        return time.is_in_range(self.open_time, self.close_time)
+        return in_range(time.minute_of_day, self.open_minutes, self.close_minutes)
     
-    def add_stock(self, product_id: str, quantity: int):
+    def add_stock(self, idx: int, quantity: int):
         """在庫を追加"""
-        if product_id not in self.inventory:
-            self.inventory[product_id] = 0
-        self.inventory[product_id] += quantity
+        inventory = self.inventory
+        if idx >= len(inventory):
+            inventory.extend([None] * (idx + 1 - len(inventory)))
+        stock = inventory[idx]
+        inventory[idx] = quantity if stock is None else stock + quantity
     
-    def has_stock(self, product_id: str, quantity: int) -> bool:
-        """在庫が十分かチェック"""
-        return product_id in self.inventory and self.inventory[product_id] >= quantity
+    def has_stock(self, idx: int, quantity: int) -> bool:
+        """在庫が十分かチェック（一度も入荷していない商品は在庫なし）"""
+        if idx >= len(self.inventory):
+            return False
+        stock = self.inventory[idx]
+        return stock is not None and stock >= quantity
     
-    def get_stock(self, product_id: str) -> int:
+    def get_stock(self, idx: int) -> int:
         """在庫数を取得"""
-        return self.inventory.get(product_id, 0)
+        if idx >= len(self.inventory):
+            return 0
+        return self.inventory[idx] or 0
     
-    def reduce_stock(self, product_id: str, quantity: int):
+    def reduce_stock(self, idx: int, quantity: int):
         """在庫を減らす"""
-        self.inventory[product_id] -= quantity
+        self.inventory[idx] -= quantity
 
 class Member:
     """会員を管理するクラス"""
+    __slots__ = ("id", "rank", "points")
+    
     def __init__(self, member_id: str, rank: str, points: int):
         self.id = member_id
         self.rank = rank
@@ -97,6 +114,8 @@ class OrderSystem:
         self.stores: Dict[str, Store] = {}
         self.products: Dict[str, Product] = {}
         self.members: Dict[str, Member] = {}
+        self.product_idx: Dict[str, int] = {}  # product_id -> 在庫リストの添字
+        self._coupon_cache: Dict[str, Tuple] = {}  # coupon_code -> 解析済みクーポン
     
     def setup_store(self, store_id: str, open_time: str, close_time: str):
         """店舗を登録"""
@@ -104,7 +123,8 @@ class OrderSystem:
     
     def setup_product(self, product_id: str, name: str, price: str, category: str):
         """商品を登録"""
-        self.products[product_id] = Product(product_id, name, int(price), category)
+        self.products[product_id] = Product(product_id, name, int(price), category,
+                                            self._get_product_idx(product_id))
     
     def setup_member(self, member_id: str, rank: str, points: str):
         """会員を登録"""
@@ -113,97 +133,124 @@ class OrderSystem:
     def add_stock(self, store_id: str, product_id: str, quantity: str):
         """在庫を追加"""
         if store_id in self.stores:
-            self.stores[store_id].add_stock(product_id, int(quantity))
+            self.stores[store_id].add_stock(self._get_product_idx(product_id), int(quantity))
+    
+    def _get_product_idx(self, product_id: str) -> int:
+        """商品IDに在庫リストの添字を割り当てる（登録前の入荷にも対応）"""
+        if product_id not in self.product_idx:
+            self.product_idx[product_id] = len(self.product_idx)
+        return self.product_idx[product_id]
     
-    def calculate_time_discount(self, time: Time, items: List[Tuple[str, int]], 
+    def calculate_subtotals(self, items: List[Tuple[Product, int]]) -> Tuple[int, Dict[str, int]]:
+        """基本価格の合計とカテゴリ別の小計を1回の走査で計算"""
+        base_total = 0
+        category_totals: Dict[str, int] = {}  # category -> 小計
+        for product, qty in items:
+            subtotal = product.price * qty
+            base_total += subtotal
+            category_totals[product.category] = category_totals.get(product.category, 0) + subtotal
+        return base_total, category_totals
+    
+    def calculate_time_discount(self, time: Time, category_totals: Dict[str, int], 
                                base_total: int) -> Tuple[int, str]:
         """時間帯割引を計算"""
         discount_amount = 0
         discount_type = ""
+        current = time.minute_of_day
         
-        # 商品カテゴリを集計
-        has_food = any(self.products[pid].category == "FOOD" for pid, _ in items)
-        has_drink = any(self.products[pid].category == "DRINK" for pid, _ in items)
-        
+        # 各割引の時間帯は互いに重ならないため、候補になる割引は高々1つ
         # モーニング割引（06:00〜10:00）：FOOD 10%OFF
-        if time.is_in_range("06:00", "10:00"):
-            food_total = sum(self.products[pid].price * qty 
-                           for pid, qty in items 
-                           if self.products[pid].category == "FOOD")
-            morning_discount = int(food_total * 0.1)
-            if morning_discount > discount_amount:
-                discount_amount = morning_discount
-                discount_type = "morning"
+        if in_range(current, *MORNING):
+            discount_amount = int(category_totals.get("FOOD", 0) * 0.1)
+            discount_type = "morning"
         
         # ランチ割引（11:00〜14:00）：FOOD+DRINKで全体15%OFF
-        if time.is_in_range("11:00", "14:00") and has_food and has_drink:
-            lunch_discount = int(base_total * 0.15)
-            if lunch_discount > discount_amount:
-                discount_amount = lunch_discount
+        elif in_range(current, *LUNCH):
+            if "FOOD" in category_totals and "DRINK" in category_totals:
+                discount_amount = int(base_total * 0.15)
                 discount_type = "lunch"
         
         # ハッピーアワー割引（17:00〜19:00）：DRINK 20%OFF
-        if time.is_in_range("17:00", "19:00"):
-            drink_total = sum(self.products[pid].price * qty 
-                            for pid, qty in items 
-                            if self.products[pid].category == "DRINK")
-            happy_discount = int(drink_total * 0.2)
-            if happy_discount > discount_amount:
-                discount_amount = happy_discount
-                discount_type = "happy"
+        elif in_range(current, *HAPPY):
+            discount_amount = int(category_totals.get("DRINK", 0) * 0.2)
+            discount_type = "happy"
         
         # 深夜割引（22:00〜06:00）：全商品5%OFF
-        if time.is_in_range("22:00", "06:00"):
-            night_discount = int(base_total * 0.05)
-            if night_discount > discount_amount:
-                discount_amount = night_discount
-                discount_type = "night"
+        elif in_range(current, *NIGHT):
+            discount_amount = int(base_total * 0.05)
+            discount_type = "night"
+        
+        # 割引額が0以下なら割引なし
+        if discount_amount <= 0:
+            discount_amount = 0
+            discount_type = ""
         
         return base_total - discount_amount, discount_type
     
-    def apply_coupon(self, coupon_code: str, items: List[Tuple[str, int]], 
-                    current_total: int) -> Tuple[int, bool]:
-        """クーポンを適用"""
-        if coupon_code == "NONE":
-            return current_total, True
+    def parse_coupon(self, coupon_code: str) -> Tuple:
+        """クーポンコードを解析（同じコードは2回目以降キャッシュを返す）"""
+        coupon = self._coupon_cache.get(coupon_code)
+        if coupon is not None:
+            return coupon
         
+        coupon = ("INVALID",)
+        if coupon_code == "NONE":
+            coupon = ("NONE",)
         # FIXED_金額
-        if coupon_code.startswith("FIXED_"):
+        elif coupon_code.startswith("FIXED_"):
             try:
-                discount = int(coupon_code[6:])
-                return max(0, current_total - discount), True
-            except:
-                return current_total, False
-        
+                coupon = ("FIXED", int(coupon_code[6:]))
+            except ValueError:
+                pass
         # PERCENT_割合
-        if coupon_code.startswith("PERCENT_"):
+        elif coupon_code.startswith("PERCENT_"):
             try:
-                percent = int(coupon_code[8:])
-                discount = int(current_total * percent / 100)
-                return current_total - discount, True
-            except:
-                return current_total, False
-        
+                coupon = ("PERCENT", int(coupon_code[8:]))
+            except ValueError:
+                pass
         # CATEGORY_カテゴリ_割合
-        if coupon_code.startswith("CATEGORY_"):
+        elif coupon_code.startswith("CATEGORY_"):
             parts = coupon_code.split('_')
             if len(parts) == 3:
-                category = parts[1]
                 try:
-                    percent = int(parts[2])
-                    # カテゴリ別の合計を計算（時間帯割引後の価格で）
-                    category_total = 0
-                    for pid, qty in items:
-                        if self.products[pid].category == category:
-                            # 時間帯割引後の単価を推定（簡略化のため、全体の割引率を適用）
-                            discount_rate = current_total / sum(self.products[p].price * q for p, q in items)
-                            discounted_price = int(self.products[pid].price * discount_rate)
-                            category_total += discounted_price * qty
-                    
-                    discount = int(category_total * percent / 100)
-                    return current_total - discount, True
-                except:
-                    return current_total, False
+                    coupon = ("CATEGORY", parts[1], int(parts[2]))
+                except ValueError:
+                    pass
+        
+        self._coupon_cache[coupon_code] = coupon
+        return coupon
+    
+    def apply_coupon(self, coupon_code: str, items: List[Tuple[Product, int]], 
+                    current_total: int, base_total: int) -> Tuple[int, bool]:
+        """クーポンを適用"""
+        coupon = self.parse_coupon(coupon_code)
+        kind = coupon[0]
+        
+        if kind == "NONE":
+            return current_total, True
+        
+        if kind == "FIXED":
+            return max(0, current_total - coupon[1]), True
+        
+        if kind == "PERCENT":
+            discount = int(current_total * coupon[1] / 100)
+            return current_total - discount, True
+        
+        if kind == "CATEGORY":
+            _, category, percent = coupon
+            # カテゴリ別の合計を計算（時間帯割引後の価格で）
+            category_total = 0
+            for product, qty in items:
+                if product.category == category:
+                    # 時間帯割引後の単価を推定（簡略化のため、全体の割引率を適用）
+                    if base_total == 0:
+                        return current_total, False
+                    discount_rate = current_total / base_total
+                    discounted_price = int(product.price * discount_rate)
+                    category_total += discounted_price * qty
+            
+            discount = int(category_total * percent / 100)
+            return current_total - discount, True
         
         return current_total, False
     
@@ -233,13 +280,13 @@ class OrderSystem:
             if product_id not in self.products:
                 return f"{time_str} ERROR: Product {product_id} not found"
             
-            items.append((product_id, quantity))
+            items.append((self.products[product_id], quantity))
         
         # 4. 在庫の確認
-        for product_id, quantity in items:
-            if not store.has_stock(product_id, quantity):
-                available = store.get_stock(product_id)
-                return f"{time_str} ERROR: Insufficient stock for product {product_id} (requested: {quantity}, available: {available})"
+        for product, quantity in items:
+            if not store.has_stock(product.idx, quantity):
+                available = store.get_stock(product.idx)
+                return f"{time_str} ERROR: Insufficient stock for product {product.id} (requested: {quantity}, available: {available})"
         
         # 5. 会員の確認
         member = None
@@ -254,13 +301,13 @@ class OrderSystem:
         
         # 7. 価格計算
         # 基本価格の計算
-        base_total = sum(self.products[pid].price * qty for pid, qty in items)
+        base_total, category_totals = self.calculate_subtotals(items)
         
         # 時間帯割引の適用
-        total_after_time_discount, _ = self.calculate_time_discount(time, items, base_total)
+        total_after_time_discount, _ = self.calculate_time_discount(time, category_totals, base_total)
         
         # クーポン割引の適用
-        total_after_coupon, coupon_valid = self.apply_coupon(coupon_code, items, total_after_time_discount)
+        total_after_coupon, coupon_valid = self.apply_coupon(coupon_code, items, total_after_time_discount, base_total)
         if not coupon_valid:
             return f"{time_str} ERROR: Invalid coupon code {coupon_code}"
         
@@ -274,8 +321,8 @@ class OrderSystem:
             points_earned = int(final_total * member.get_point_rate())
         
         # 8. 在庫の更新
-        for product_id, quantity in items:
-            store.reduce_stock(product_id, quantity)
+        for product, quantity in items:
+            store.reduce_stock(product.idx, quantity)
         
         # 9. ポイントの更新
         if member:
@@ -290,57 +337,43 @@ class CommandProcessor:
     """コマンド処理を管理するクラス"""
     def __init__(self, system: OrderSystem):
         self.system = system
-        self.commands = {
-            "SETUP_STORE": self.setup_store,
-            "SETUP_PRODUCT": self.setup_product,
-            "SETUP_MEMBER": self.setup_member,
-            "ADD_STOCK": self.add_stock,
-            "ORDER": self.order
-        }
-    
-    def setup_store(self, *args):
-        """SETUP_STORE store_id open_time close_time"""
-        self.system.setup_store(*args)
-    
-    def setup_product(self, *args):
-        """SETUP_PRODUCT product_id name price category"""
-        self.system.setup_product(*args)
-    
-    def setup_member(self, *args):
-        """SETUP_MEMBER member_id rank points"""
-        self.system.setup_member(*args)
-    
-    def add_stock(self, *args):
-        """ADD_STOCK store_id product_id quantity"""
-        self.system.add_stock(*args)
-    
-    def order(self, *args):
-        """ORDER time store_id member_id items coupon_code use_points"""
-        result = self.system.process_order(*args)
-        print(result)
+        self.output: List[str] = []  # 出力はまとめて最後に書き出す
     
     def process(self, line: str):
         """コマンドラインを処理"""
-        if not line.strip():
-            return
-        
-        parts = line.strip().split()
+        # 引数が最も多い ORDER に合わせて分割を打ち切る
+        parts = line.split(None, 6)
         if not parts:
             return
         
         command = parts[0]
-        args = parts[1:]
         
-        if command in self.commands:
-            self.commands[command](*args)
+        if command == "ORDER":
+            # ORDER time store_id member_id items coupon_code use_points
+            self.output.append(self.system.process_order(*parts[1:]))
+        elif command == "ADD_STOCK":
+            # ADD_STOCK store_id product_id quantity
+            self.system.add_stock(*parts[1:])
+        elif command == "SETUP_PRODUCT":
+            # SETUP_PRODUCT product_id name price category
+            self.system.setup_product(*parts[1:])
+        elif command == "SETUP_MEMBER":
+            # SETUP_MEMBER member_id rank points
+            self.system.setup_member(*parts[1:])
+        elif command == "SETUP_STORE":
+            # SETUP_STORE store_id open_time close_time
+            self.system.setup_store(*parts[1:])
 
 def main():
     system = OrderSystem()
     processor = CommandProcessor(system)
     
-    # 標準入力からコマンドを読み込み
-    for line in sys.stdin:
+    # 標準入力からコマンドを一括で読み込み
+    for line in sys.stdin.buffer.read().decode().splitlines():
         processor.process(line)
+    
+    if processor.output:
+        sys.stdout.write("\n".join(processor.output) + "\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
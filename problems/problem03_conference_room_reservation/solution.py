@@ -1,44 +1,74 @@
 import sys
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from datetime import date
+from functools import lru_cache
+
+# 営業時間（00:00からの経過分）
+BUSINESS_OPEN = 9 * 60
+BUSINESS_CLOSE = 18 * 60
+
+# 最初に払い出す予約ID（以降は1ずつ増える）
+FIRST_BOOKING_ID = 10001
+
+# 解析済みの日付・時刻文字列（同じ文字列は何度も現れるため使い回す）
+_DATE_CACHE = {}  # "YYYY-MM-DD" -> 日付の通し番号
+_TIME_CACHE = {}  # "HH:MM" -> 00:00からの経過分
+
+def parse_date(date_str):
+    """日付文字列（YYYY-MM-DD 固定）を通し番号に変換"""
+    ordinal = _DATE_CACHE.get(date_str)
+    if ordinal is None:
+        ordinal = date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])).toordinal()
+        _DATE_CACHE[date_str] = ordinal
+    return ordinal
+
+def parse_time(time_str):
+    """時刻文字列（HH:MM 固定）を00:00からの経過分に変換"""
+    minutes = _TIME_CACHE.get(time_str)
+    if minutes is None:
+        minutes = _TIME_CACHE[time_str] = int(time_str[0:2]) * 60 + int(time_str[3:5])
+    return minutes
 
 class DateTime:
     """日時を管理するクラス"""
-    def __init__(self, date_str, time_str):
+    __slots__ = ("date_str", "time_str", "weekday", "ordinal", "minutes", "key")
+    
+    def __init__(self, date_str, time_str, ordinal=None):
         self.date_str = date_str
         self.time_str = time_str
-        self.dt = datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+        # 曜日と日付の通し番号は生成時に一度だけ計算する
+        self.ordinal = parse_date(date_str) if ordinal is None else ordinal
+        # 通し番号1（0001-01-01）は月曜日なので、曜日は通し番号から求まる
+        self.weekday = (self.ordinal + 6) % 7
+        self.minutes = parse_time(time_str)
+        # 区間索引で使う通算分（日付の通し番号 * 1440 + 時刻の分）
+        self.key = self.ordinal * 1440 + self.minutes
     
     def __str__(self):
         return f"{self.date_str} {self.time_str}"
     
     def __eq__(self, other):
-        return self.dt == other.dt
+        return self.key == other.key
+    
+    def __hash__(self):
+        return self.key
     
     def __lt__(self, other):
-        return self.dt < other.dt
+        return self.key < other.key
     
     def __le__(self, other):
-        return self.dt <= other.dt
-    
-    def is_business_day(self):
-        """平日かチェック（月〜金）"""
-        return self.dt.weekday() < 5
-    
-    def is_business_hours(self):
-        """営業時間内かチェック（09:00以上18:00未満）"""
-        hour_minutes = self.dt.hour * 60 + self.dt.minute
-        return 9 * 60 <= hour_minutes < 18 * 60
-    
-    def is_15_minute_interval(self):
-        """15分単位かチェック"""
-        return self.dt.minute % 15 == 0
-    
-    def duration_minutes(self, other):
-        """他のDateTimeとの時間差を分で返す"""
-        return int((other.dt - self.dt).total_seconds() / 60)
+        return self.key <= other.key
+
+@lru_cache(maxsize=4096)
+def make_datetime(date_str, time_str):
+    """DateTimeを生成（生成後に変更しないので同じ日時は使い回す）"""
+    return DateTime(date_str, time_str)
 
 class Room:
     """会議室を管理するクラス"""
+    __slots__ = ("id", "name", "capacity", "equipment_type")
+    
     def __init__(self, room_id, name, capacity, equipment_type):
         self.id = room_id
         self.name = name
@@ -47,6 +77,8 @@ class Room:
 
 class Employee:
     """社員を管理するクラス"""
+    __slots__ = ("id", "name", "department")
+    
     def __init__(self, employee_id, name, department):
         self.id = employee_id
         self.name = name
@@ -54,26 +86,63 @@ class Employee:
 
 class Booking:
     """予約を管理するクラス"""
+    __slots__ = ("id", "employee_id", "room_id", "start_datetime", "end_datetime", "participants", "active")
+    
     def __init__(self, booking_id, employee_id, room_id, start_datetime, end_datetime, participants):
-        self.id = str(booking_id)
+        self.id = booking_id  # 整数で保持し、文字列にするのは出力時のみ
         self.employee_id = employee_id
         self.room_id = room_id
         self.start_datetime = start_datetime
         self.end_datetime = end_datetime
         self.participants = int(participants)
-        self.status = "ACTIVE"
-    
-    def is_overlapping(self, start_datetime, end_datetime):
-        """時間帯が重複するかチェック"""
-        return not (self.end_datetime <= start_datetime or end_datetime <= self.start_datetime)
-    
-    def is_active(self):
-        """予約が有効かチェック"""
-        return self.status == "ACTIVE"
+        self.active = True
     
     def cancel(self):
         """予約を取り消し"""
-        self.status = "CANCELLED"
+        self.active = False
+
+class IntervalIndex:
+    """有効な予約を開始時刻順に保持する区間索引
+
+    同じ会議室（または同じ社員）の有効な予約は互いに重ならないため、
+    開始時刻順に並べると終了時刻も昇順になる。
+    """
+    __slots__ = ("starts", "ends", "bookings")
+    
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.bookings = []
+    
+    def insert(self, start, end, booking):
+        """予約を追加"""
+        i = bisect_left(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.bookings.insert(i, booking)
+    
+    def remove(self, start):
+        """指定した開始時刻の予約を削除"""
+        i = bisect_left(self.starts, start)
+        del self.starts[i]
+        del self.ends[i]
+        del self.bookings[i]
+    
+    def overlap(self, start, end):
+        """[start, end) と重なる予約を返す"""
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        return self.bookings[i:j]
+    
+    def intersect_any(self, start, end):
+        """[start, end) と重なる予約が1件でもあるか判定"""
+        # 終了が start より後の最初の予約だけを見れば足りる
+        i = bisect_right(self.ends, start)
+        return i < len(self.starts) and self.starts[i] < end
+    
+    def starting_between(self, low, high):
+        """開始時刻が [low, high) に含まれる予約を開始時刻順に返す"""
+        return self.bookings[bisect_left(self.starts, low):bisect_left(self.starts, high)]
 
 class BookingValidator:
     """予約のバリデーションを担当するクラス"""
@@ -82,111 +151,109 @@ class BookingValidator:
     
     def validate(self, employee_id, room_id, start_datetime, end_datetime, participants):
         """予約の妥当性をチェック"""
+        system = self.system
+        
         # 社員の存在確認
-        if employee_id not in self.system.employees:
+        if employee_id not in system.employees:
             return f"ERROR: Employee {employee_id} not found"
         
-        # 会議室の存在確認
-        if room_id not in self.system.rooms:
+        # 会議室の存在確認（収容人数の確認でも使うので取得しておく）
+        room = system.rooms.get(room_id)
+        if room is None:
             return f"ERROR: Room {room_id} not found"
         
-        # 営業時間と営業日の確認
-        if not self._is_valid_business_time(start_datetime, end_datetime):
+        start_key, end_key = start_datetime.key, end_datetime.key
+        start_minutes, end_minutes = start_datetime.minutes, end_datetime.minutes
+        
+        # 営業時間と営業日の確認（終了は18:00ちょうどまで可）
+        if not (start_datetime.weekday < 5 and end_datetime.weekday < 5 and
+                BUSINESS_OPEN <= start_minutes < BUSINESS_CLOSE and
+                BUSINESS_OPEN <= end_minutes <= BUSINESS_CLOSE):
             return "ERROR: Booking outside business hours (Mon-Fri 09:00-18:00)"
         
         # 過去の時刻の確認
-        if start_datetime < self.system.current_datetime:
+        if start_key < system.current_datetime.key:
             return "ERROR: Cannot book in the past"
         
         # 開始時刻が終了時刻より前かチェック
-        if start_datetime >= end_datetime:
+        if start_key >= end_key:
             return "ERROR: Start time must be before end time"
         
         # 15分単位の確認
-        if not self._is_15_minute_intervals(start_datetime, end_datetime):
+        if start_minutes % 15 or end_minutes % 15:
             return "ERROR: Time must be in 15-minute intervals"
         
         # 予約時間の確認
-        duration = start_datetime.duration_minutes(end_datetime)
+        duration = end_key - start_key
         if duration < 30:
             return "ERROR: Minimum booking duration is 30 minutes"
         if duration > 240:
             return "ERROR: Maximum booking duration is 4 hours"
         
         # 収容人数の確認
-        room = self.system.rooms[room_id]
         if int(participants) > room.capacity:
             return f"ERROR: Participants exceed room capacity (capacity: {room.capacity})"
         
-        # 重複予約の確認
-        overlap_error = self._check_overlapping_bookings(employee_id, room_id, start_datetime, end_datetime)
-        if overlap_error:
-            return overlap_error
-        
-        return None
-    
-    def _is_valid_business_time(self, start_datetime, end_datetime):
-        """営業時間と営業日をチェック"""
-        return (start_datetime.is_business_day() and 
-                end_datetime.is_business_day() and
-                start_datetime.is_business_hours() and 
-                end_datetime.is_business_hours())
-    
-    def _is_15_minute_intervals(self, start_datetime, end_datetime):
-        """15分単位かチェック"""
-        return (start_datetime.is_15_minute_interval() and 
-                end_datetime.is_15_minute_interval())
+        # 重複予約の確認（最もコストが高いので最後）
+        return self._check_overlapping_bookings(employee_id, room_id, start_datetime, end_datetime)
     
     def _check_overlapping_bookings(self, employee_id, room_id, start_datetime, end_datetime):
         """重複予約をチェック"""
-        for booking in self.system.bookings.values():
-            if not booking.is_active():
-                continue
-            
-            if booking.is_overlapping(start_datetime, end_datetime):
-                # 会議室の重複
-                if booking.room_id == room_id:
-                    return f"ERROR: Room {room_id} is already booked for this time"
-                # 社員の重複
-                if booking.employee_id == employee_id:
-                    return f"ERROR: Employee {employee_id} already has a booking for this time"
-        
-        return None
+        start, end = start_datetime.key, end_datetime.key
+        room_tree = self.system.room_trees.get(room_id)
+        employee_tree = self.system.employee_trees.get(employee_id)
+        room_conflict = room_tree is not None and room_tree.intersect_any(start, end)
+        if employee_tree is None or not employee_tree.intersect_any(start, end):
+            if not room_conflict:
+                return None
+            # 会議室の重複
+            return f"ERROR: Room {room_id} is already booked for this time"
+        
+        # 両方と重なる場合だけ重なる予約を取り出し、作成順で先の予約に応じてエラーを返す
+        if room_conflict and (min(b.id for b in room_tree.overlap(start, end)) <=
+                              min(b.id for b in employee_tree.overlap(start, end))):
+            return f"ERROR: Room {room_id} is already booked for this time"
+        # 社員の重複
+        return f"ERROR: Employee {employee_id} already has a booking for this time"
 
 class RecurringBookingGenerator:
     """繰り返し予約の生成を担当するクラス"""
     def __init__(self, system):
         self.system = system
     
-    def generate_weekly_bookings_optimized(self, employee_id, room_id, start_time, end_time, participants, start_date, end_date):
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+    def generate_weekly_bookings(self, employee_id, room_id, start_time, end_time, participants, start_date, end_date):
+        """開始日と同じ曜日に毎週予約を作成"""
+        start_ordinal = parse_date(start_date)
+        end_ordinal = parse_date(end_date)
         
-        bookings_created = 0
-        current_dt = start_dt
+        validator = self.system.validator
+        occurrences = []
         
-        while current_dt <= end_dt:
-            current_date_str = current_dt.strftime("%Y-%m-%d")
-            start_datetime = DateTime(current_date_str, start_time)
-            end_datetime = DateTime(current_date_str, end_time)
+        # 開始日から7日刻みで終了日まで（曜日は開始日と同じ）
+        for ordinal in range(start_ordinal, end_ordinal + 1, 7):
+            current_date_str = date.fromordinal(ordinal).isoformat()
+            # 通し番号は分かっているので日付文字列は解析し直さない
+            start_datetime = DateTime(current_date_str, start_time, ordinal)
+            end_datetime = DateTime(current_date_str, end_time, ordinal)
                 
             # バリデーション
-            error = self.system.validator.validate(employee_id, room_id, start_datetime, end_datetime, participants)
+            # 曜日・時刻・人数は毎回同じで日付は後ろにずれていくだけなので、
+            # 初回に全項目を確認すれば2回目以降は重複の確認だけでよい
+            if ordinal == start_ordinal:
+                error = validator.validate(employee_id, room_id, start_datetime, end_datetime, participants)
+            else:
+                error = validator._check_overlapping_bookings(employee_id, room_id, start_datetime, end_datetime)
             if error:
                 return error, 0
             
+            occurrences.append((start_datetime, end_datetime))
+        
+        # 全回のバリデーションが通ってから予約を作成する（途中でエラーなら1件も作らない）
+        # 各回は日付が異なるので、作成する予約どうしが重なることはない
+        for start_datetime, end_datetime in occurrences:
             self.system._create_booking(employee_id, room_id, start_datetime, end_datetime, participants)
-            # 予約作成処理
-            bookings_created += 1
-            
-            # 次の週の同じ曜日へ
-            current_dt += timedelta(days=7)
-            
-            # 終了日を超えた場合は終了
-            if current_dt > end_dt:
-                break
         
-        return None, bookings_created
+        return None, len(occurrences)
 
 class BookingSystem:
     """会議室予約システムのメインクラス"""
@@ -194,14 +261,16 @@ class BookingSystem:
         self.current_datetime = None
         self.rooms = {}
         self.employees = {}
-        self.bookings = {}
-        self.next_booking_id = 10001
+        self.bookings = []  # 予約ID - FIRST_BOOKING_ID の位置に格納
+        self.room_trees = defaultdict(IntervalIndex)
+        self.employee_trees = defaultdict(IntervalIndex)
+        self.output = []  # 出力はまとめて最後に書き出す
         self.validator = BookingValidator(self)
         self.recurring_generator = RecurringBookingGenerator(self)
     
     def set_time(self, date_str, time_str):
         """現在時刻を設定"""
-        self.current_datetime = DateTime(date_str, time_str)
+        self.current_datetime = make_datetime(date_str, time_str)
     
     def setup_room(self, room_id, name, capacity, equipment_type):
         """会議室を登録"""
@@ -213,16 +282,16 @@ class BookingSystem:
     
     def book(self, employee_id, room_id, start_date, start_time, end_date, end_time, participants):
         """単発予約"""
-        start_datetime = DateTime(start_date, start_time)
-        end_datetime = DateTime(end_date, end_time)
+        start_datetime = make_datetime(start_date, start_time)
+        end_datetime = make_datetime(end_date, end_time)
         
         error = self.validator.validate(employee_id, room_id, start_datetime, end_datetime, participants)
         if error:
-            print(error)
+            self.output.append(error)
             return
         
         booking_id = self._create_booking(employee_id, room_id, start_datetime, end_datetime, participants)
-        print(f"BOOKING_SUCCESS: {booking_id} booked for {employee_id} in room {room_id} from {start_datetime} to {end_datetime}")
+        self.output.append(f"BOOKING_SUCCESS: {booking_id} booked for {employee_id} in room {room_id} from {start_date} {start_time} to {end_date} {end_time}")
     
     def book_recurring(self, employee_id, room_id, start_time, end_time, participants, start_date, end_date):
         """繰り返し予約"""
@@ -231,86 +300,93 @@ class BookingSystem:
         )
         
         if error:
-            print(error)
+            self.output.append(error)
             return
         
-        print(f"RECURRING_SUCCESS: {bookings_created} bookings created from {start_date} to {end_date}")
+        self.output.append(f"RECURRING_SUCCESS: {bookings_created} bookings created from {start_date} to {end_date}")
     
     def cancel(self, booking_id):
         """予約取り消し"""
-        if booking_id not in self.bookings:
-            print(f"ERROR: Booking {booking_id} not found")
+        booking = self._find_booking(booking_id)
+        if booking is None:
+            self.output.append(f"ERROR: Booking {booking_id} not found")
             return
         
-        booking = self.bookings[booking_id]
-        if booking.status == "CANCELLED":
-            print(f"ERROR: Booking {booking_id} is already cancelled")
+        if not booking.active:
+            self.output.append(f"ERROR: Booking {booking_id} is already cancelled")
             return
         
         booking.cancel()
-        print(f"CANCEL_SUCCESS: Booking {booking_id} cancelled")
+        self.room_trees[booking.room_id].remove(booking.start_datetime.key)
+        self.employee_trees[booking.employee_id].remove(booking.start_datetime.key)
+        self.output.append(f"CANCEL_SUCCESS: Booking {booking_id} cancelled")
     
     def status(self, room_id, date_str):
         """会議室の予約状況を表示"""
-        print(f"ROOM_STATUS {room_id} {date_str}:")
+        self.output.append(f"ROOM_STATUS {room_id} {date_str}:")
         
         # 指定日の予約を取得
         day_bookings = self._get_room_bookings_for_date(room_id, date_str)
         
         if not day_bookings:
-            print("No bookings")
+            self.output.append("No bookings")
             return
         
-        # 時刻順にソート
-        day_bookings.sort(key=lambda b: b.start_datetime.dt)
-        
         for booking in day_bookings:
             employee_name = self.employees[booking.employee_id].name
-            print(f"{booking.start_datetime.time_str}-{booking.end_datetime.time_str}: {booking.id} ({employee_name}, {booking.participants}人)")
+            self.output.append(f"{booking.start_datetime.time_str}-{booking.end_datetime.time_str}: {booking.id} ({employee_name}, {booking.participants}人)")
     
     def list_employee(self, employee_id, start_date, end_date):
         """社員の予約一覧を表示"""
-        print(f"EMPLOYEE_BOOKINGS {employee_id}:")
+        self.output.append(f"EMPLOYEE_BOOKINGS {employee_id}:")
         
         # 期間内の予約を取得
         employee_bookings = self._get_employee_bookings_for_period(employee_id, start_date, end_date)
         
         if not employee_bookings:
-            print("No bookings")
+            self.output.append("No bookings")
             return
         
-        # 日時順にソート
-        employee_bookings.sort(key=lambda b: b.start_datetime.dt)
-        
         for booking in employee_bookings:
-            print(f"{booking.start_datetime.date_str} {booking.start_datetime.time_str}-{booking.end_datetime.time_str}: {booking.room_id} ({booking.participants}人) {booking.id}")
+            self.output.append(f"{booking.start_datetime.date_str} {booking.start_datetime.time_str}-{booking.end_datetime.time_str}: {booking.room_id} ({booking.participants}人) {booking.id}")
     
     def _create_booking(self, employee_id, room_id, start_datetime, end_datetime, participants):
         """予約を作成"""
-        booking_id = str(self.next_booking_id)
-        self.next_booking_id += 1
+        booking_id = FIRST_BOOKING_ID + len(self.bookings)
         
         booking = Booking(booking_id, employee_id, room_id, start_datetime, end_datetime, participants)
-        self.bookings[booking_id] = booking
+        self.bookings.append(booking)
+        self.room_trees[room_id].insert(start_datetime.key, end_datetime.key, booking)
+        self.employee_trees[employee_id].insert(start_datetime.key, end_datetime.key, booking)
         
         return booking_id
     
+    def _find_booking(self, booking_id):
+        """予約IDの文字列から予約を取得（存在しなければ None）"""
+        # "010001" のように表記の異なるIDは別物として扱う
+        if not (booking_id.isascii() and booking_id.isdigit()) or booking_id[0] == "0":
+            return None
+        index = int(booking_id) - FIRST_BOOKING_ID
+        if not 0 <= index < len(self.bookings):
+            return None
+        return self.bookings[index]
+    
     def _get_room_bookings_for_date(self, room_id, target_date):
-        """指定会議室の指定日の予約を取得"""
-        return [booking for booking in self.bookings.values()
-                if (booking.is_active() and 
-                    booking.room_id == room_id and 
-                    booking.start_datetime.date_str == target_date)]
+        """指定会議室の指定日の予約を開始時刻順に取得"""
+        room_tree = self.room_trees.get(room_id)
+        if room_tree is None:
+            return []
+        ordinal = parse_date(target_date)
+        return room_tree.starting_between(ordinal * 1440, (ordinal + 1) * 1440)
     
     def _get_employee_bookings_for_period(self, employee_id, start_date, end_date):
-        """指定社員の指定期間の予約を取得"""
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-        
-        return [booking for booking in self.bookings.values()
-                if (booking.is_active() and 
-                    booking.employee_id == employee_id and
-                    start_dt <= booking.start_datetime.dt.replace(hour=0, minute=0, second=0, microsecond=0) <= end_dt)]
+        """指定社員の指定期間の予約を開始時刻順に取得"""
+        employee_tree = self.employee_trees.get(employee_id)
+        if employee_tree is None:
+            return []
+        start_ordinal = parse_date(start_date)
+        end_ordinal = parse_date(end_date)
+        return employee_tree.starting_between(start_ordinal * 1440, (end_ordinal + 1) * 1440)
 
 class CommandProcessor:
     """コマンド処理を管理するクラス"""
@@ -327,60 +403,59 @@ class CommandProcessor:
             "LIST_EMPLOYEE": self.list_employee
         }
     
-    def set_time(self, *args):
+    def set_time(self, parts):
         """SET_TIME date time"""
-        self.system.set_time(*args)
+        self.system.set_time(parts[1], parts[2])
     
-    def setup_room(self, *args):
+    def setup_room(self, parts):
         """SETUP_ROOM room_id name capacity equipment_type"""
-        self.system.setup_room(*args)
+        self.system.setup_room(parts[1], parts[2], parts[3], parts[4])
     
-    def setup_employee(self, *args):
+    def setup_employee(self, parts):
         """SETUP_EMPLOYEE employee_id name department"""
-        self.system.setup_employee(*args)
+        self.system.setup_employee(parts[1], parts[2], parts[3])
     
-    def book(self, *args):
+    def book(self, parts):
         """BOOK employee_id room_id start_date start_time end_date end_time participants"""
-        self.system.book(*args)
+        self.system.book(parts[1], parts[2], parts[3], parts[4], parts[5], parts[6], parts[7])
     
-    def book_recurring(self, *args):
+    def book_recurring(self, parts):
         """BOOK_RECURRING employee_id room_id start_time end_time participants start_date end_date"""
-        self.system.book_recurring(*args)
+        self.system.book_recurring(parts[1], parts[2], parts[3], parts[4], parts[5], parts[6], parts[7])
     
-    def cancel(self, *args):
+    def cancel(self, parts):
         """CANCEL booking_id"""
-        self.system.cancel(*args)
+        self.system.cancel(parts[1])
     
-    def status(self, *args):
+    def status(self, parts):
         """STATUS room_id date"""
-        self.system.status(*args)
+        self.system.status(parts[1], parts[2])
     
-    def list_employee(self, *args):
+    def list_employee(self, parts):
         """LIST_EMPLOYEE employee_id start_date end_date"""
-        self.system.list_employee(*args)
+        self.system.list_employee(parts[1], parts[2], parts[3])
     
     def process(self, line):
         """コマンドラインを処理"""
-        if not line.strip():
-            return
-        
-        parts = line.strip().split()
+        # 最後の引数に末尾の空白が残らないよう、分割回数は制限しない
+        parts = line.split()
         if not parts:
             return
         
-        command = parts[0]
-        args = parts[1:]
-        
-        if command in self.commands:
-            self.commands[command](*args)
+        handler = self.commands.get(parts[0])
+        if handler is not None:
+            handler(parts)
 
 def main():
     system = BookingSystem()
     processor = CommandProcessor(system)
     
-    # 標準入力からコマンドを読み込み
-    for line in sys.stdin:
+    # 標準入力からコマンドを一括で読み込み
+    for line in sys.stdin.buffer.read().decode().splitlines():
         processor.process(line)
+    
+    if system.output:
+        sys.stdout.write("\n".join(system.output) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,42 +1,52 @@
 import sys
-from datetime import datetime, time
 
 class TimeManager:
     """時刻管理クラス"""
+    __slots__ = ("time_str", "minutes", "day_of_week", "weekday", "maintenance", "business_hours", "time_zone")
+    
     def __init__(self, time_str, day_of_week):
         self.time_str = time_str
-        self.time_obj = datetime.strptime(time_str, "%H:%M").time()
+        # 書式は HH:MM 固定なので切り出して00:00からの経過分に変換
+        self.minutes = int(time_str[0:2]) * 60 + int(time_str[3:5])
         self.day_of_week = int(day_of_week)  # 0=月曜日, 6=日曜日
+        
+        # 時刻は変わらないので、各判定は生成時に一度だけ行う
+        self.weekday = self.day_of_week < 5
+        self.maintenance = self.minutes >= 23 * 60 + 30 or self.minutes <= 30
+        self.business_hours = self.weekday and 9 * 60 <= self.minutes <= 15 * 60
+        self.time_zone = self._compute_time_zone()
     
     def __str__(self):
         return self.time_str
     
     def is_maintenance_time(self):
         """メンテナンス時間（23:30-00:30）かチェック"""
-        return (self.time_obj >= time(23, 30) or 
-                self.time_obj <= time(0, 30))
-    
-    def is_weekday(self):
-        """平日かチェック"""
-        return self.day_of_week < 5
+        return self.maintenance
     
     def is_business_hours(self):
         """営業時間（平日9:00-15:00）かチェック"""
-        return (self.is_weekday() and 
-                time(9, 0) <= self.time_obj <= time(15, 0))
+        return self.business_hours
     
     def get_time_zone(self):
         """時間帯区分を取得"""
-        if not self.is_weekday():
+        return self.time_zone
+    
+    def _compute_time_zone(self):
+        """時間帯区分を判定"""
+        if not self.weekday:
             return "WEEKEND"
         
-        if time(8, 0) <= self.time_obj < time(18, 0):
+        if 8 * 60 <= self.minutes < 18 * 60:
             return "WEEKDAY_DAYTIME"
         else:
             return "WEEKDAY_NIGHTTIME"
 
 class Account:
     """口座クラス"""
+    __slots__ = ("account_number", "name", "pin_code", "balance", "account_type", "status",
+                 "failed_attempts", "daily_withdrawal", "daily_transfer", "vip", "category",
+                 "withdrawal_limits", "transfer_limits")
+    
     def __init__(self, account_number, name, pin_code, balance, account_type):
         self.account_number = account_number
         self.name = name
@@ -47,10 +57,23 @@ class Account:
         self.failed_attempts = 0
         self.daily_withdrawal = 0
         self.daily_transfer = 0
+        self.vip = None
+        self.update_category()
+    
+    def update_category(self):
+        """残高に応じてVIP判定と会員区分・取引上限を更新"""
+        vip = self.account_type == "VIP" or self.balance >= 5000000
+        if vip == self.vip:
+            return
+        self.vip = vip
+        self.category = category = "VIP" if vip else "NORMAL"
+        self.withdrawal_limits = TransactionValidator.WITHDRAWAL_LIMITS[category]
+        self.transfer_limits = TransactionValidator.TRANSFER_LIMITS[category]
     
-    def is_vip(self):
-        """VIP会員かどうか判定"""
-        return self.account_type == "VIP" or self.balance >= 5000000
+    def add_balance(self, amount):
+        """残高を増減し、会員区分を更新"""
+        self.balance += amount
+        self.update_category()
     
     def is_locked(self):
         """口座がロックされているかチェック"""
@@ -80,14 +103,15 @@ class Account:
 class TransactionValidator:
     """取引バリデーター"""
     
+    # 会員区分 -> (1回の上限, 1日の上限)
     WITHDRAWAL_LIMITS = {
-        "NORMAL": {"daily": 500000, "single": 200000},
-        "VIP": {"daily": 1000000, "single": 200000}
+        "NORMAL": (200000, 500000),
+        "VIP": (200000, 1000000)
     }
     
     TRANSFER_LIMITS = {
-        "NORMAL": {"daily": 1000000, "single": 1000000},
-        "VIP": {"daily": 3000000, "single": 1000000}
+        "NORMAL": (1000000, 1000000),
+        "VIP": (1000000, 3000000)
     }
     
     @classmethod
@@ -102,14 +126,13 @@ class TransactionValidator:
         if amount % 1000 != 0:
             return "ERROR: Invalid amount"
         
-        account_type = "VIP" if account.is_vip() else "NORMAL"
-        limits = cls.WITHDRAWAL_LIMITS[account_type]
+        single, daily = account.withdrawal_limits
         
-        if amount > limits["single"]:
+        if amount > single:
             return "ERROR: Invalid amount"
         
-        if account.daily_withdrawal + amount > limits["daily"]:
-            return f"ERROR: Daily withdrawal limit exceeded (limit: {limits['daily']}, attempted: {amount})"
+        if account.daily_withdrawal + amount > daily:
+            return f"ERROR: Daily withdrawal limit exceeded (limit: {daily}, attempted: {amount})"
         
         return None
     
@@ -119,18 +142,17 @@ class TransactionValidator:
         if amount <= 0:
             return "ERROR: Invalid amount"
         
-        account_type = "VIP" if account.is_vip() else "NORMAL"
-        limits = cls.TRANSFER_LIMITS[account_type]
+        single, daily = account.transfer_limits
         
-        if amount > limits["single"]:
+        if amount > single:
             return "ERROR: Invalid amount"
         
         # 大口取引時間チェック
         if amount >= 1000000 and not time_manager.is_business_hours():
             return "ERROR: Large amount transactions only available on weekdays 09:00-15:00"
         
-        if account.daily_transfer + amount > limits["daily"]:
-            return f"ERROR: Daily transfer limit exceeded (limit: {limits['daily']}, attempted: {amount})"
+        if account.daily_transfer + amount > daily:
+            return f"ERROR: Daily transfer limit exceeded (limit: {daily}, attempted: {amount})"
         
         return None
     
@@ -144,41 +166,26 @@ class TransactionValidator:
 class FeeCalculator:
     """手数料計算クラス"""
     
+    # (会員区分, 時間帯, 取引種別) -> 手数料
     FEE_TABLE = {
-        "NORMAL": {
-            "WEEKDAY_DAYTIME": {
-                "WITHDRAW": 110,
-                "TRANSFER_SAME": 110,
-                "TRANSFER_OTHER": 440
-            },
-            "WEEKDAY_NIGHTTIME": {
-                "WITHDRAW": 220,
-                "TRANSFER_SAME": 220,
-                "TRANSFER_OTHER": 550
-            },
-            "WEEKEND": {
-                "WITHDRAW": 220,
-                "TRANSFER_SAME": 220,
-                "TRANSFER_OTHER": 550
-            }
-        },
-        "VIP": {
-            "WEEKDAY_DAYTIME": {
-                "WITHDRAW": 0,
-                "TRANSFER_SAME": 0,
-                "TRANSFER_OTHER": 220
-            },
-            "WEEKDAY_NIGHTTIME": {
-                "WITHDRAW": 110,
-                "TRANSFER_SAME": 110,
-                "TRANSFER_OTHER": 330
-            },
-            "WEEKEND": {
-                "WITHDRAW": 110,
-                "TRANSFER_SAME": 110,
-                "TRANSFER_OTHER": 330
-            }
-        }
+        ("NORMAL", "WEEKDAY_DAYTIME", "WITHDRAW"): 110,
+        ("NORMAL", "WEEKDAY_DAYTIME", "TRANSFER_SAME"): 110,
+        ("NORMAL", "WEEKDAY_DAYTIME", "TRANSFER_OTHER"): 440,
+        ("NORMAL", "WEEKDAY_NIGHTTIME", "WITHDRAW"): 220,
+        ("NORMAL", "WEEKDAY_NIGHTTIME", "TRANSFER_SAME"): 220,
+        ("NORMAL", "WEEKDAY_NIGHTTIME", "TRANSFER_OTHER"): 550,
+        ("NORMAL", "WEEKEND", "WITHDRAW"): 220,
+        ("NORMAL", "WEEKEND", "TRANSFER_SAME"): 220,
+        ("NORMAL", "WEEKEND", "TRANSFER_OTHER"): 550,
+        ("VIP", "WEEKDAY_DAYTIME", "WITHDRAW"): 0,
+        ("VIP", "WEEKDAY_DAYTIME", "TRANSFER_SAME"): 0,
+        ("VIP", "WEEKDAY_DAYTIME", "TRANSFER_OTHER"): 220,
+        ("VIP", "WEEKDAY_NIGHTTIME", "WITHDRAW"): 110,
+        ("VIP", "WEEKDAY_NIGHTTIME", "TRANSFER_SAME"): 110,
+        ("VIP", "WEEKDAY_NIGHTTIME", "TRANSFER_OTHER"): 330,
+        ("VIP", "WEEKEND", "WITHDRAW"): 110,
+        ("VIP", "WEEKEND", "TRANSFER_SAME"): 110,
+        ("VIP", "WEEKEND", "TRANSFER_OTHER"): 330,
     }
     
     @classmethod
@@ -187,13 +194,11 @@ class FeeCalculator:
         if transaction_type in ["DEPOSIT", "BALANCE"]:
             return 0
         
-        account_category = "VIP" if account.is_vip() else "NORMAL"
-        
         if transaction_type == "WITHDRAW":
-            return cls.FEE_TABLE[account_category][time_zone]["WITHDRAW"]
+            return cls.FEE_TABLE[(account.category, time_zone, "WITHDRAW")]
         elif transaction_type == "TRANSFER":
             transfer_key = f"TRANSFER_{bank_type}"
-            return cls.FEE_TABLE[account_category][time_zone][transfer_key]
+            return cls.FEE_TABLE[(account.category, time_zone, transfer_key)]
         
         return 0
 
@@ -202,6 +207,13 @@ class ATMSystem:
     def __init__(self):
         self.accounts = {}
         self.current_time = None
+        self.output = []  # 出力はまとめて最後に書き出す
+    
+    @property
+    def time_str(self):
+        """出力に付ける時刻（SET_TIME 前は None と表示）"""
+        current_time = self.current_time
+        return "None" if current_time is None else current_time.time_str
     
     def set_time(self, time_str, day_of_week):
         """現在時刻設定"""
@@ -243,9 +255,9 @@ class ATMSystem:
         error = self._basic_validation(account_number, pin_code)
         if error:
             if error == "LOCK_TRIGGERED":
-                print(f"{self.current_time} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
+                self.output.append(f"{self.time_str} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
                 return
-            print(f"{self.current_time} {error}")
+            self.output.append(f"{self.time_str} {error}")
             return
         
         amount = int(amount)
@@ -253,7 +265,7 @@ class ATMSystem:
         # 金額バリデーション
         validation_error = TransactionValidator.validate_deposit(amount)
         if validation_error:
-            print(f"{self.current_time} {validation_error}")
+            self.output.append(f"{self.time_str} {validation_error}")
             return
         
         account = self.accounts[account_number]
@@ -261,18 +273,18 @@ class ATMSystem:
         fee = FeeCalculator.calculate_fee(account, "DEPOSIT", time_zone)
         
         # 残高更新
-        account.balance += amount
+        account.add_balance(amount)
         
-        print(f"{self.current_time} DEPOSIT_SUCCESS: Account {account_number}, Amount {amount}, Balance {account.balance}, Fee {fee}")
+        self.output.append(f"{self.time_str} DEPOSIT_SUCCESS: Account {account_number}, Amount {amount}, Balance {account.balance}, Fee {fee}")
     
     def withdraw(self, account_number, pin_code, amount):
         """引出し処理"""
         error = self._basic_validation(account_number, pin_code)
         if error:
             if error == "LOCK_TRIGGERED":
-                print(f"{self.current_time} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
+                self.output.append(f"{self.time_str} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
                 return
-            print(f"{self.current_time} {error}")
+            self.output.append(f"{self.time_str} {error}")
             return
         
         amount = int(amount)
@@ -281,7 +293,7 @@ class ATMSystem:
         # 引出しバリデーション
         validation_error = TransactionValidator.validate_withdrawal(account, amount)
         if validation_error:
-            print(f"{self.current_time} {validation_error}")
+            self.output.append(f"{self.time_str} {validation_error}")
             return
         
         time_zone = self.current_time.get_time_zone()
@@ -290,30 +302,30 @@ class ATMSystem:
         
         # 残高チェック
         if account.balance < total_required:
-            print(f"{self.current_time} ERROR: Insufficient balance (available: {account.balance}, required: {total_required})")
+            self.output.append(f"{self.time_str} ERROR: Insufficient balance (available: {account.balance}, required: {total_required})")
             return
         
         # 取引実行
-        account.balance -= total_required
+        account.add_balance(-total_required)
         account.daily_withdrawal += amount
         
-        print(f"{self.current_time} WITHDRAW_SUCCESS: Account {account_number}, Amount {amount}, Balance {account.balance}, Fee {fee}")
+        self.output.append(f"{self.time_str} WITHDRAW_SUCCESS: Account {account_number}, Amount {amount}, Balance {account.balance}, Fee {fee}")
     
     def transfer(self, from_account, pin_code, to_account, amount, bank_type):
         """振込処理"""
         error = self._basic_validation(from_account, pin_code)
         if error:
             if error == "LOCK_TRIGGERED":
-                print(f"{self.current_time} ACCOUNT_LOCKED: Account {from_account} has been locked due to multiple failed attempts")
+                self.output.append(f"{self.time_str} ACCOUNT_LOCKED: Account {from_account} has been locked due to multiple failed attempts")
                 return
-            print(f"{self.current_time} {error}")
+            self.output.append(f"{self.time_str} {error}")
             return
         
         amount = int(amount)
         
         # 振込先口座チェック
         if to_account not in self.accounts:
-            print(f"{self.current_time} ERROR: Destination account {to_account} not found")
+            self.output.append(f"{self.time_str} ERROR: Destination account {to_account} not found")
             return
         
         from_acc = self.accounts[from_account]
@@ -321,7 +333,7 @@ class ATMSystem:
         # 振込バリデーション
         validation_error = TransactionValidator.validate_transfer(from_acc, amount, self.current_time)
         if validation_error:
-            print(f"{self.current_time} {validation_error}")
+            self.output.append(f"{self.time_str} {validation_error}")
             return
         
         time_zone = self.current_time.get_time_zone()
@@ -331,38 +343,38 @@ class ATMSystem:
         
         # 残高チェック
         if from_acc.balance < total_required:
-            print(f"{self.current_time} ERROR: Insufficient balance (available: {from_acc.balance}, required: {total_required})")
+            self.output.append(f"{self.time_str} ERROR: Insufficient balance (available: {from_acc.balance}, required: {total_required})")
             return
         
         # 取引実行
-        from_acc.balance -= total_required
+        from_acc.add_balance(-total_required)
         from_acc.daily_transfer += amount
-        self.accounts[to_account].balance += amount
+        self.accounts[to_account].add_balance(amount)
         
-        print(f"{self.current_time} TRANSFER_SUCCESS: From {from_account}, To {to_account}, Amount {amount}, Fee {fee}")
+        self.output.append(f"{self.time_str} TRANSFER_SUCCESS: From {from_account}, To {to_account}, Amount {amount}, Fee {fee}")
     
     def balance(self, account_number, pin_code):
         """残高照会"""
         error = self._basic_validation(account_number, pin_code)
         if error:
             if error == "LOCK_TRIGGERED":
-                print(f"{self.current_time} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
+                self.output.append(f"{self.time_str} ACCOUNT_LOCKED: Account {account_number} has been locked due to multiple failed attempts")
                 return
-            print(f"{self.current_time} {error}")
+            self.output.append(f"{self.time_str} {error}")
             return
         
         account = self.accounts[account_number]
-        print(f"{self.current_time} BALANCE_SUCCESS: Account {account_number}, Balance {account.balance}")
+        self.output.append(f"{self.time_str} BALANCE_SUCCESS: Account {account_number}, Balance {account.balance}")
     
     def unlock(self, account_number):
         """口座ロック解除"""
         if account_number not in self.accounts:
-            print(f"{self.current_time} ERROR: Account {account_number} not found")
+            self.output.append(f"{self.time_str} ERROR: Account {account_number} not found")
             return
         
         account = self.accounts[account_number]
         account.unlock()
-        print(f"{self.current_time} UNLOCK_SUCCESS: Account {account_number} unlocked")
+        self.output.append(f"{self.time_str} UNLOCK_SUCCESS: Account {account_number} unlocked")
     
     def reset_daily(self):
         """日次リセット"""
@@ -386,23 +398,26 @@ class CommandProcessor:
     
     def process(self, line):
         """コマンド処理"""
-        if not line.strip():
+        # split() は前後の空白も取り除くので strip() は不要
+        parts = line.split()
+        if not parts:
             return
         
-        parts = line.strip().split()
-        command = parts[0]
-        args = parts[1:]
-        
-        if command in self.commands:
-            self.commands[command](*args)
+        handler = self.commands.get(parts[0])
+        if handler is not None:
+            handler(*parts[1:])
 
 def main():
     """メイン関数"""
     system = ATMSystem()
     processor = CommandProcessor(system)
     
-    for line in sys.stdin:
+    # 標準入力からコマンドを一括で読み込み
+    for line in sys.stdin.buffer.read().decode().splitlines():
         processor.process(line)
+    
+    if system.output:
+        sys.stdout.write("\n".join(system.output) + "\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file